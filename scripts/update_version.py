@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Version management helper for vultr-dns-mcp.
+
+The canonical package version lives in ``pyproject.toml``;
+``src/vultr_dns_mcp/_version.py`` derives its value from installed
+package metadata, so pyproject.toml is the only file that needs
+rewriting when bumping a release.
+
+Usage:
+    python scripts/update_version.py            # print current version
+    python scripts/update_version.py --set 1.2.3
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+PYPROJECT_PATH = Path(__file__).resolve().parent.parent / "pyproject.toml"
+
+_SEMVER_RE = re.compile(
+    r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)"
+    r"(?:-[0-9A-Za-z.-]+)?(?:\+[0-9A-Za-z.-]+)?$"
+)
+_VERSION_LINE_RE = re.compile(r'^version\s*=\s*"([^"]+)"', re.MULTILINE)
+
+
+def validate_version(version: str) -> bool:
+    """Check that a version string is valid semver (e.g. '1.0.4')."""
+    # Plain X.Y.Z is the overwhelmingly common case; a split + isdigit
+    # scan is much cheaper than engaging the regex engine for it.
+    parts = version.split(".")
+    if len(parts) == 3 and all(
+        p.isascii() and p.isdigit() and (p == "0" or p[0] != "0") for p in parts
+    ):
+        return True
+    return bool(_SEMVER_RE.match(version))
+
+
+def get_version(content: str) -> str:
+    """Extract the current version from pyproject.toml content."""
+    match = _VERSION_LINE_RE.search(content)
+    if not match:
+        raise ValueError(f"No version field found in {PYPROJECT_PATH}")
+    return match.group(1)
+
+
+def _render_pyproject(content: str, version: str) -> str:
+    """Return pyproject.toml content with the version field replaced."""
+    # The version line sits near the top of the [project] table, so a
+    # bounded scan and string splice avoids running a regex over the
+    # whole file. Fall back to the regex path if the layout surprises us.
+    try:
+        start = content.index("[project]")
+        line_start = content.index("\nversion", start, start + 512) + 1
+        q1 = content.index('"', line_start)
+        q2 = content.index('"', q1 + 1)
+    except ValueError:
+        return _VERSION_LINE_RE.sub(f'version = "{version}"', content, count=1)
+    return f'{content[:q1]}"{version}"{content[q2 + 1:]}'
+
+
+def _atomic_write(path: Path, content: str) -> None:
+    """Write content to path atomically via a temp file and os.replace."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as tmp:
+            tmp.write(content)
+        Path(tmp_name).replace(path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print or update the package version."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--set", dest="new_version", help="New version to set")
+    args = parser.parse_args(argv)
+
+    content = PYPROJECT_PATH.read_text()
+    current = get_version(content)
+
+    if args.new_version is None:
+        print(current)
+        return 0
+
+    if not validate_version(args.new_version):
+        print(f"❌ Invalid version: {args.new_version}", file=sys.stderr)
+        return 1
+
+    # Render the new content fully in memory, then replace the file in a
+    # single atomic rename so a partial failure can't leave it corrupted.
+    _atomic_write(PYPROJECT_PATH, _render_pyproject(content, args.new_version))
+    print(f"✅ Version updated: {current} → {args.new_version}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -266,7 +266,9 @@ def add_record(
 @records.command("delete")
 @click.argument("domain")
 @click.argument("record_id")
-@click.confirmation_option(prompt="Are you sure you want to delete this record?")
+@click.confirmation_option(
+    "--yes", "-y", prompt="Are you sure you want to delete this record?"
+)
 @click.pass_context
 def delete_record(ctx: click.Context, domain: str, record_id: str):
     """Delete a DNS record."""
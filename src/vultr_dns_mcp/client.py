@@ -5,6 +5,7 @@ This module provides a high-level client interface for common DNS operations
 without requiring the full MCP server setup.
 """
 
+import asyncio
 from typing import Any
 
 from .server import VultrDNSServer
@@ -244,24 +245,26 @@ class VultrDNSClient:
         """
         results = {"domain": domain, "created_records": [], "errors": []}
 
-        try:
-            # Create root A record
-            root_result = await self.add_a_record(domain, "@", ip, ttl)
-            if "error" not in root_result:
-                results["created_records"].append("A record for root domain")
-            else:
-                results["errors"].append(f"Root A record: {root_result['error']}")
+        # The records are independent, so create them concurrently and
+        # let gather keep per-record outcomes in submission order.
+        names = ["@"]
+        if include_www:
+            names.append("www")
 
-            # Create www record if requested
-            if include_www:
-                www_result = await self.add_a_record(domain, "www", ip, ttl)
-                if "error" not in www_result:
-                    results["created_records"].append("A record for www subdomain")
-                else:
-                    results["errors"].append(f"WWW A record: {www_result['error']}")
+        outcomes = await asyncio.gather(
+            *(self.add_a_record(domain, name, ip, ttl) for name in names),
+            return_exceptions=True,
+        )
 
-        except Exception as e:
-            results["errors"].append(f"Setup failed: {e!s}")
+        for name, outcome in zip(names, outcomes, strict=True):
+            label = "root domain" if name == "@" else f"{name} subdomain"
+            if isinstance(outcome, BaseException):
+                results["errors"].append(f"Setup failed: {outcome!s}")
+            elif "error" not in outcome:
+                results["created_records"].append(f"A record for {label}")
+            else:
+                prefix = "Root A record" if name == "@" else "WWW A record"
+                results["errors"].append(f"{prefix}: {outcome['error']}")
 
         return results
 
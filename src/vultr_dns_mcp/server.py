@@ -142,12 +142,117 @@ class VultrDNSServer:
         )
 
 
-def create_mcp_server(api_key: str | None = None) -> Server:
+def validate_dns_record(
+    record_type: str,
+    name: str,
+    data: str,
+    ttl: int | None = None,
+    priority: int | None = None,
+) -> dict[str, Any]:
+    """
+    Validate DNS record parameters before creation.
+
+    Args:
+        record_type: Record type (A, AAAA, CNAME, MX, TXT, NS, SRV)
+        name: Record name/subdomain
+        data: Record value
+        ttl: Time to live in seconds (optional)
+        priority: Priority for MX/SRV records (optional)
+
+    Returns:
+        Dictionary echoing the record parameters plus a validation
+        section with valid flag, errors, warnings, and suggestions
+    """
+    validation_result = {
+        "valid": True,
+        "errors": [],
+        "warnings": [],
+        "suggestions": [],
+    }
+
+    # Validate record type
+    valid_types = ["A", "AAAA", "CNAME", "MX", "TXT", "NS", "SRV"]
+    if record_type.upper() not in valid_types:
+        validation_result["valid"] = False
+        validation_result["errors"].append(
+            f"Invalid record type. Must be one of: {', '.join(valid_types)}"
+        )
+
+    record_type = record_type.upper()
+
+    # Validate TTL
+    if ttl is not None:
+        if ttl < 60 or ttl > 86400:
+            validation_result["warnings"].append(
+                "TTL should be between 60 and 86400 seconds"
+            )
+        elif ttl < 300:
+            validation_result["warnings"].append(
+                "Low TTL values may impact DNS performance"
+            )
+
+    # Record-specific validation
+    if record_type == "A":
+        ipv4_pattern = r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$"
+        if not re.match(ipv4_pattern, data):
+            validation_result["valid"] = False
+            validation_result["errors"].append("Invalid IPv4 address format")
+
+    elif record_type == "AAAA":
+        if ":" in data and data.count("::") > 1:
+            validation_result["valid"] = False
+            validation_result["errors"].append(
+                "Invalid IPv6 address: multiple :: sequences"
+            )
+
+    elif record_type == "CNAME":
+        if name in {"@", ""}:
+            validation_result["valid"] = False
+            validation_result["errors"].append(
+                "CNAME records cannot be used for root domain (@)"
+            )
+
+    elif record_type == "MX":
+        if priority is None:
+            validation_result["valid"] = False
+            validation_result["errors"].append("MX records require a priority value")
+        elif priority < 0 or priority > 65535:
+            validation_result["valid"] = False
+            validation_result["errors"].append(
+                "MX priority must be between 0 and 65535"
+            )
+
+    elif record_type == "SRV":
+        if priority is None:
+            validation_result["valid"] = False
+            validation_result["errors"].append("SRV records require a priority value")
+        srv_parts = data.split()
+        if len(srv_parts) != 3:
+            validation_result["valid"] = False
+            validation_result["errors"].append(
+                "SRV data must be in format: 'weight port target'"
+            )
+
+    return {
+        "record_type": record_type,
+        "name": name,
+        "data": data,
+        "ttl": ttl,
+        "priority": priority,
+        "validation": validation_result,
+    }
+
+
+def create_mcp_server(
+    api_key: str | None = None, client: VultrDNSServer | None = None
+) -> Server:
     """
     Create and configure an MCP server for Vultr DNS management.
 
     Args:
         api_key: Vultr API key. If not provided, will read from VULTR_API_KEY env var.
+        client: Pre-built Vultr API client to use instead of constructing one
+            from the API key. Intended for tests that inject a stub client.
 
     Returns:
         Configured MCP server instance
@@ -167,7 +272,7 @@ def create_mcp_server(api_key: str | None = None) -> Server:
     server = Server("vultr-dns-mcp")
 
     # Initialize Vultr client
-    vultr_client = VultrDNSServer(api_key)
+    vultr_client = client if client is not None else VultrDNSServer(api_key)
 
     # Add resources for client discovery
     @server.list_resources()
@@ -559,96 +664,13 @@ def create_mcp_server(api_key: str | None = None) -> Server:
                 ]
 
             elif name == "validate_dns_record":
-                record_type = arguments["record_type"]
-                name = arguments["name"]
-                data = arguments["data"]
-                ttl = arguments.get("ttl")
-                priority = arguments.get("priority")
-
-                validation_result = {
-                    "valid": True,
-                    "errors": [],
-                    "warnings": [],
-                    "suggestions": [],
-                }
-
-                # Validate record type
-                valid_types = ["A", "AAAA", "CNAME", "MX", "TXT", "NS", "SRV"]
-                if record_type.upper() not in valid_types:
-                    validation_result["valid"] = False
-                    validation_result["errors"].append(
-                        f"Invalid record type. Must be one of: {', '.join(valid_types)}"
-                    )
-
-                record_type = record_type.upper()
-
-                # Validate TTL
-                if ttl is not None:
-                    if ttl < 60 or ttl > 86400:
-                        validation_result["warnings"].append(
-                            "TTL should be between 60 and 86400 seconds"
-                        )
-                    elif ttl < 300:
-                        validation_result["warnings"].append(
-                            "Low TTL values may impact DNS performance"
-                        )
-
-                # Record-specific validation
-                if record_type == "A":
-                    ipv4_pattern = r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$"
-                    if not re.match(ipv4_pattern, data):
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(
-                            "Invalid IPv4 address format"
-                        )
-
-                elif record_type == "AAAA":
-                    if ":" in data and data.count("::") > 1:
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(
-                            "Invalid IPv6 address: multiple :: sequences"
-                        )
-
-                elif record_type == "CNAME":
-                    if name in {"@", ""}:
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(
-                            "CNAME records cannot be used for root domain (@)"
-                        )
-
-                elif record_type == "MX":
-                    if priority is None:
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(
-                            "MX records require a priority value"
-                        )
-                    elif priority < 0 or priority > 65535:
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(
-                            "MX priority must be between 0 and 65535"
-                        )
-
-                elif record_type == "SRV":
-                    if priority is None:
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(
-                            "SRV records require a priority value"
-                        )
-                    srv_parts = data.split()
-                    if len(srv_parts) != 3:
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(
-                            "SRV data must be in format: 'weight port target'"
-                        )
-
-                result = {
-                    "record_type": record_type,
-                    "name": name,
-                    "data": data,
-                    "ttl": ttl,
-                    "priority": priority,
-                    "validation": validation_result,
-                }
+                result = validate_dns_record(
+                    arguments["record_type"],
+                    arguments["name"],
+                    arguments["data"],
+                    arguments.get("ttl"),
+                    arguments.get("priority"),
+                )
                 return [TextContent(type="text", text=str(result))]
 
             elif name == "analyze_dns_records":
@@ -1,86 +1,219 @@
 """Pytest configuration and shared fixtures."""
 
 import asyncio
-import os
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
+from click.testing import CliRunner
+
+import vultr_dns_mcp.cli
+import vultr_dns_mcp.client
+import vultr_dns_mcp.server
+
+# Keep the CLI module (and its compiled Click command tree) imported for
+# the whole session so patching never triggers a re-import.
+_cli_module = vultr_dns_mcp.cli
+
+# Canned return values used to (re)seed the shared CLI client mock.
+_CLI_CLIENT_RETURNS = {
+    "domains": [
+        {"domain": "example.com", "date_created": "2023-01-01T00:00:00+00:00"},
+        {"domain": "test.com", "date_created": "2023-01-02T00:00:00+00:00"},
+    ],
+    "get_domain_summary": {
+        "domain": "example.com",
+        "total_records": 3,
+        "record_types": {"A": 2, "MX": 1},
+        "configuration": {
+            "has_root_record": True,
+            "has_www_subdomain": True,
+            "has_email_setup": False,
+        },
+    },
+    "add_domain": {"domain": {"domain": "newdomain.com"}},
+    "records": [
+        {
+            "id": "record-1",
+            "type": "A",
+            "name": "www",
+            "data": "192.168.1.1",
+            "ttl": 300,
+        }
+    ],
+    "find_records_by_type": [
+        {
+            "id": "record-1",
+            "type": "A",
+            "name": "www",
+            "data": "192.168.1.1",
+            "ttl": 300,
+        }
+    ],
+    "add_record": {"id": "record-456"},
+    "remove_record": True,
+    "setup_basic_website": {
+        "domain": "example.com",
+        "created_records": [
+            "A record for root domain",
+            "A record for www subdomain",
+        ],
+        "errors": [],
+    },
+    "setup_email": {
+        "domain": "example.com",
+        "created_records": ["MX record for mail.example.com"],
+        "errors": [],
+    },
+}
+
+
+# Canned return values used to (re)seed the shared VultrDNSServer mock.
+_VULTR_SERVER_RETURNS = {
+    "list_domains": {
+        "domains": [
+            {"domain": "example.com", "status": "active"},
+            {"domain": "test.com", "status": "active"},
+        ]
+    },
+    "get_domain": {"domain": {"domain": "example.com", "status": "active"}},
+    "create_domain": {"domain": {"domain": "newdomain.com", "status": "active"}},
+    "delete_domain": {},
+    "list_records": {
+        "records": [
+            {
+                "id": "123",
+                "type": "A",
+                "name": "www",
+                "data": "192.168.1.1",
+                "ttl": 300,
+            }
+        ]
+    },
+    "get_record": {
+        "record": {
+            "id": "123",
+            "type": "A",
+            "name": "www",
+            "data": "192.168.1.1",
+            "ttl": 300,
+        }
+    },
+    "create_record": {
+        "record": {
+            "id": "456",
+            "type": "A",
+            "name": "www",
+            "data": "192.168.1.100",
+            "ttl": 300,
+        }
+    },
+    "update_record": {
+        "record": {
+            "id": "123",
+            "type": "A",
+            "name": "www",
+            "data": "192.168.1.200",
+            "ttl": 300,
+        }
+    },
+    "delete_record": {},
+}
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """Provide a shared CliRunner; invoke() keeps no state on the runner."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def _mock_client_template():
+    """Build the CLI client mock once per session.
+
+    Only the methods the CLI actually awaits get AsyncMock children;
+    everything else stays on the cheaper MagicMock machinery.
+    """
+    client = MagicMock()
+    for name in _CLI_CLIENT_RETURNS:
+        setattr(client, name, AsyncMock())
+    return client
 
 
 @pytest.fixture
-def mock_api_key():
-    """Provide a mock API key for testing."""
-    return "test-api-key-12345"
+def mock_client_for_cli(_mock_client_template):
+    """Provide the shared CLI client mock, re-seeded for each test."""
+    client = _mock_client_template
+    client.reset_mock(return_value=True, side_effect=True)
+    for name, value in _CLI_CLIENT_RETURNS.items():
+        getattr(client, name).return_value = value
+    return client
 
 
 @pytest.fixture
-def mock_vultr_client():
-    """Provide a mock VultrDNSServer client."""
-    client = MagicMock()
+def client(patched_server, mock_api_key):
+    """Provide a VultrDNSClient wired to the patched server mock."""
+    return vultr_dns_mcp.client.VultrDNSClient(mock_api_key)
 
-    # Mock async methods to return AsyncMock
-    client.list_domains = AsyncMock(
-        return_value={
-            "domains": [
-                {"domain": "example.com", "status": "active"},
-                {"domain": "test.com", "status": "active"},
-            ]
-        }
-    )
 
-    client.get_domain = AsyncMock(
-        return_value={"domain": {"domain": "example.com", "status": "active"}}
-    )
+@pytest.fixture(scope="session")
+def mock_api_key():
+    """Provide a mock API key for testing."""
+    return "test-api-key-12345"
 
-    client.create_domain = AsyncMock(
-        return_value={"domain": {"domain": "newdomain.com", "status": "active"}}
-    )
 
-    client.delete_domain = AsyncMock(return_value={})
-
-    client.list_records = AsyncMock(
-        return_value={
-            "records": [
-                {
-                    "id": "123",
-                    "type": "A",
-                    "name": "www",
-                    "data": "192.168.1.1",
-                    "ttl": 300,
-                }
-            ]
-        }
-    )
+@pytest.fixture(scope="session")
+def vultr_server(mock_api_key):
+    """Provide one shared VultrDNSServer for the whole session.
 
-    client.create_record = AsyncMock(
-        return_value={
-            "record": {
-                "id": "456",
-                "type": "A",
-                "name": "www",
-                "data": "192.168.1.100",
-                "ttl": 300,
-            }
-        }
-    )
+    The api-key-only constructor has no side effects and the tests never
+    mutate the instance, so there is no reason to rebuild it per test.
+    """
+    return vultr_dns_mcp.server.VultrDNSServer(mock_api_key)
 
-    client.update_record = AsyncMock(
-        return_value={
-            "record": {
-                "id": "123",
-                "type": "A",
-                "name": "www",
-                "data": "192.168.1.200",
-                "ttl": 300,
-            }
-        }
-    )
 
-    client.delete_record = AsyncMock(return_value={})
+@pytest.fixture(scope="session")
+def _vultr_server_template():
+    """Build the VultrDNSServer mock once per session.
+
+    AsyncMock construction is expensive enough to dominate short unit
+    tests, so the prototype is built once and re-seeded per test rather
+    than rebuilt. (copy.copy on a MagicMock just returns a fresh stub
+    from __copy__, so the reset-and-reseed pattern is used instead.)
+    """
+    client = MagicMock()
+    for name in _VULTR_SERVER_RETURNS:
+        setattr(client, name, AsyncMock())
+    return client
 
+
+@pytest.fixture
+def mock_vultr_client(_vultr_server_template):
+    """Provide the shared VultrDNSServer mock, re-seeded for each test."""
+    client = _vultr_server_template
+    client.reset_mock(return_value=True, side_effect=True)
+    for name, value in _VULTR_SERVER_RETURNS.items():
+        getattr(client, name).return_value = value
     return client
 
 
+@pytest.fixture
+def patched_server(monkeypatch, mock_vultr_client):
+    """Install the server mock in place of VultrDNSServer for the client.
+
+    A single attribute swap via monkeypatch is much cheaper than a
+    patch() context per test, which re-resolves its string target on
+    every enter/exit.
+    """
+    monkeypatch.setattr(
+        vultr_dns_mcp.client,
+        "VultrDNSServer",
+        lambda *args, **kwargs: mock_vultr_client,
+    )
+    return mock_vultr_client
+
+
 @pytest.fixture
 def mcp_server(mock_api_key):
     """Provide an MCP server instance for testing."""
@@ -89,22 +222,36 @@ def mcp_server(mock_api_key):
     return create_mcp_server(mock_api_key)
 
 
-@pytest.fixture
-def clean_environment():
-    """Clean environment variables for testing."""
-    original_api_key = os.environ.get("VULTR_API_KEY")
+@pytest.fixture(scope="session")
+def built_server():
+    """Construct the real (unmocked) MCP server once per session.
 
-    # Clean up before test
-    if "VULTR_API_KEY" in os.environ:
-        del os.environ["VULTR_API_KEY"]
+    Attribute-introspection tests only look at the constructed object,
+    so they share one instance instead of re-running tool and resource
+    registration per test.
+    """
+    return vultr_dns_mcp.server.create_mcp_server("test-api-key-for-testing")
 
-    yield
 
-    # Restore after test
-    if original_api_key:
-        os.environ["VULTR_API_KEY"] = original_api_key
-    elif "VULTR_API_KEY" in os.environ:
-        del os.environ["VULTR_API_KEY"]
+@pytest.fixture(scope="session")
+def mcp_server_session(_vultr_server_template):
+    """Create the MCP server once per session, bound to the shared mock.
+
+    Tool and resource registration only needs to happen once; the mock
+    template is injected directly through create_mcp_server's client
+    parameter (no patching), and the mock_vultr_client fixture reseeds
+    that same template before each test.
+    """
+    return vultr_dns_mcp.server.create_mcp_server(
+        "test-api-key", client=_vultr_server_template
+    )
+
+
+@pytest.fixture
+def clean_environment(monkeypatch):
+    """Clean environment variables for testing."""
+    monkeypatch.delenv("VULTR_API_KEY", raising=False)
+    yield
 
 
 @pytest.fixture
@@ -116,80 +263,129 @@ def temp_config_dir(tmp_path):
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
+def cli_event_loop():
+    """Provide one long-lived loop for CLI commands that call asyncio.run.
+
+    Creating and destroying a loop per command invocation (selector,
+    signal handlers, default executor) is pure overhead in tests; the
+    CLI tests patch asyncio.run over to this loop instead.
+    """
+    loop = asyncio.new_event_loop()
     yield loop
     loop.close()
 
 
 @pytest.fixture
-def mock_httpx_response():
-    """Provide a mock httpx response for testing."""
-    response = MagicMock()
-    response.status_code = 200
-    response.json = MagicMock(return_value={"success": True})
-    response.text = "OK"
-    return response
+def mock_request(vultr_server, monkeypatch):
+    """Swap the shared server's _make_request for a fresh AsyncMock.
+
+    A direct attribute swap via monkeypatch avoids the patch.object
+    machinery per test; monkeypatch restores the real method afterwards.
+    """
+    mock = AsyncMock()
+    monkeypatch.setattr(vultr_server, "_make_request", mock)
+    return mock
 
 
 @pytest.fixture
+def mock_httpx_client(monkeypatch):
+    """Intercept httpx.AsyncClient and expose the inner request mock.
+
+    The async context-manager scaffolding is identical in every
+    _make_request test, so it is built here once; tests only set
+    mock_httpx_client.request.return_value to the response they need.
+    The inner mock is spec'd against httpx.AsyncClient so attribute
+    typos fail instead of silently passing.
+    """
+    instance = MagicMock(spec=httpx.AsyncClient)
+    instance.request = AsyncMock()
+    client_cls = MagicMock()
+    client_cls.return_value.__aenter__ = AsyncMock(return_value=instance)
+    client_cls.return_value.__aexit__ = AsyncMock(return_value=None)
+    monkeypatch.setattr(httpx, "AsyncClient", client_cls)
+    return instance
+
+
+@pytest.fixture(scope="session")
+def build_response():
+    """Build a lightweight httpx-like response object.
+
+    SimpleNamespace is allocation-cheap compared to a MagicMock and
+    covers the three attributes _make_request actually touches.
+    """
+
+    def _build(status_code, json_data=None, text=""):
+        return SimpleNamespace(
+            status_code=status_code, json=lambda: json_data, text=text
+        )
+
+    return _build
+
+
+@pytest.fixture(scope="session")
 def sample_dns_records():
-    """Provide sample DNS records for testing."""
-    return [
-        {
-            "id": "record-1",
-            "type": "A",
-            "name": "@",
-            "data": "192.168.1.1",
-            "ttl": 300,
-            "priority": None,
-        },
-        {
-            "id": "record-2",
-            "type": "A",
-            "name": "www",
-            "data": "192.168.1.1",
-            "ttl": 300,
-            "priority": None,
-        },
-        {
-            "id": "record-3",
-            "type": "MX",
-            "name": "@",
-            "data": "mail.example.com",
-            "ttl": 3600,
-            "priority": 10,
-        },
-        {
-            "id": "record-4",
-            "type": "CNAME",
-            "name": "blog",
-            "data": "example.com",
-            "ttl": 300,
-            "priority": None,
-        },
-    ]
+    """Provide sample DNS records for testing.
+
+    The records are consumed read-only, so they are built once per
+    session as an immutable tuple of read-only mapping views.
+    """
+    return tuple(
+        MappingProxyType(record)
+        for record in [
+            {
+                "id": "record-1",
+                "type": "A",
+                "name": "@",
+                "data": "192.168.1.1",
+                "ttl": 300,
+                "priority": None,
+            },
+            {
+                "id": "record-2",
+                "type": "A",
+                "name": "www",
+                "data": "192.168.1.1",
+                "ttl": 300,
+                "priority": None,
+            },
+            {
+                "id": "record-3",
+                "type": "MX",
+                "name": "@",
+                "data": "mail.example.com",
+                "ttl": 3600,
+                "priority": 10,
+            },
+            {
+                "id": "record-4",
+                "type": "CNAME",
+                "name": "blog",
+                "data": "example.com",
+                "ttl": 300,
+                "priority": None,
+            },
+        ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_domains():
     """Provide sample domains for testing."""
-    return [
-        {
-            "domain": "example.com",
-            "date_created": "2023-01-01T00:00:00+00:00",
-            "dns_sec": "disabled",
-        },
-        {
-            "domain": "test.com",
-            "date_created": "2023-01-02T00:00:00+00:00",
-            "dns_sec": "enabled",
-        },
-    ]
+    return tuple(
+        MappingProxyType(domain)
+        for domain in [
+            {
+                "domain": "example.com",
+                "date_created": "2023-01-01T00:00:00+00:00",
+                "dns_sec": "disabled",
+            },
+            {
+                "domain": "test.com",
+                "date_created": "2023-01-02T00:00:00+00:00",
+                "dns_sec": "enabled",
+            },
+        ]
+    )
 
 
 # Configure pytest markers
@@ -209,11 +405,7 @@ def pytest_configure(config):
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers and skip conditions."""
 
-    # Add slow marker to async tests by default
     for item in items:
-        if asyncio.iscoroutinefunction(item.function):
-            item.add_marker(pytest.mark.slow)
-
         if "integration" in item.name:
             item.add_marker(pytest.mark.integration)
 
@@ -0,0 +1,261 @@
+"""Tests for CLI functionality."""
+
+import os
+from unittest.mock import AsyncMock
+
+import click
+import pytest
+
+from vultr_dns_mcp import cli as cli_mod
+from vultr_dns_mcp.cli import cli
+
+pytestmark = pytest.mark.unit
+
+# Shared argv sequences, built once instead of per test body.
+ARGV_DOMAINS_LIST = ("domains", "list")
+ARGV_RECORDS_LIST = ("records", "list", "example.com")
+ARGV_CREATE_DOMAIN = ("domains", "create", "newdomain.com", "192.168.1.100")
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _default_api_key():
+    """Provide a default API key for every CLI invocation in this module."""
+    os.environ["VULTR_API_KEY"] = "test-key"
+    yield
+    os.environ.pop("VULTR_API_KEY", None)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _reuse_event_loop(cli_event_loop):
+    """Run CLI coroutines on the shared session loop instead of asyncio.run."""
+    original = cli_mod.asyncio.run
+    cli_mod.asyncio.run = cli_event_loop.run_until_complete
+    yield
+    cli_mod.asyncio.run = original
+
+
+@pytest.fixture
+def patched_client(mock_client_for_cli, monkeypatch):
+    """Install the shared client mock in place of VultrDNSClient."""
+    monkeypatch.setattr(
+        cli_mod, "VultrDNSClient", lambda *args, **kwargs: mock_client_for_cli
+    )
+    return mock_client_for_cli
+
+
+def test_cli_help(cli_runner):
+    """Test that the CLI shows help output."""
+    result = cli_runner.invoke(cli, ["--help"], catch_exceptions=False)
+    assert result.exit_code == 0
+    assert "Vultr DNS MCP" in result.output
+
+
+def test_cli_version(cli_runner):
+    """Test that the CLI reports a version."""
+    result = cli_runner.invoke(cli, ["--version"], catch_exceptions=False)
+    assert result.exit_code == 0
+
+
+def test_missing_arguments(cli_runner):
+    """Test that missing required arguments fail."""
+    result = cli_runner.invoke(
+        cli, ["records", "add", "example.com"], catch_exceptions=False
+    )
+    assert result.exit_code != 0
+
+
+def test_invalid_command(cli_runner):
+    """Test that unknown commands fail."""
+    result = cli_runner.invoke(cli, ["not-a-command"], catch_exceptions=False)
+    assert result.exit_code != 0
+
+
+def test_cli_without_api_key(cli_runner, clean_environment):
+    """Test that commands requiring an API key fail without one."""
+    result = cli_runner.invoke(cli, list(ARGV_DOMAINS_LIST))
+    assert result.exit_code == 1
+    assert "VULTR_API_KEY is required" in result.output
+
+
+def test_server_command_without_api_key(cli_runner, clean_environment):
+    """Test that the server command fails without an API key."""
+    result = cli_runner.invoke(cli, ["server"])
+    assert result.exit_code == 1
+    assert "VULTR_API_KEY is required" in result.output
+
+
+def test_server_command_with_api_key(cli_runner, monkeypatch):
+    """Test that the server command starts with an API key."""
+    mock_run_server = AsyncMock()
+    monkeypatch.setattr(cli_mod, "run_server", mock_run_server)
+    result = cli_runner.invoke(cli, ["server"])
+    assert result.exit_code == 0
+    assert "Starting Vultr DNS MCP Server" in result.output
+    mock_run_server.assert_called_once_with("test-key")
+
+
+def test_server_command_with_error(cli_runner, monkeypatch):
+    """Test that server startup errors are reported."""
+    mock_run_server = AsyncMock(side_effect=Exception("Startup failed"))
+    monkeypatch.setattr(cli_mod, "run_server", mock_run_server)
+    result = cli_runner.invoke(cli, ["server"])
+    assert result.exit_code == 1
+    assert "Server error" in result.output
+
+
+def test_domains_happy_paths(cli_runner, patched_client):
+    """Test the list, info, and create happy paths in one pass."""
+    result = cli_runner.invoke(cli, list(ARGV_DOMAINS_LIST))
+    assert result.exit_code == 0
+    assert "example.com" in result.output
+    assert "Found 2 domain(s)" in result.output
+
+    result = cli_runner.invoke(cli, ["domains", "info", "example.com"])
+    assert result.exit_code == 0
+    assert "Total Records: 3" in result.output
+
+    result = cli_runner.invoke(cli, list(ARGV_CREATE_DOMAIN))
+    assert result.exit_code == 0
+    assert "Created domain newdomain.com" in result.output
+    patched_client.add_domain.assert_called_once_with("newdomain.com", "192.168.1.100")
+
+
+def test_records_happy_paths(cli_runner, patched_client):
+    """Test the list, filtered list, and add happy paths in one pass."""
+    result = cli_runner.invoke(cli, list(ARGV_RECORDS_LIST))
+    assert result.exit_code == 0
+    assert "192.168.1.1" in result.output
+
+    result = cli_runner.invoke(cli, ["records", "list", "example.com", "--type", "A"])
+    assert result.exit_code == 0
+    patched_client.find_records_by_type.assert_called_once_with("example.com", "A")
+
+    result = cli_runner.invoke(
+        cli, ["records", "add", "example.com", "A", "www", "192.168.1.100"]
+    )
+    assert result.exit_code == 0
+    assert "Created A record" in result.output
+
+
+def test_add_record_with_ttl_and_priority(patched_client):
+    """Test adding a record with TTL and priority options."""
+    # Only the client call matters here, so skip Click's parser and
+    # runner entirely and drive the command callback directly.
+    ctx = click.Context(cli_mod.add_record, obj={"api_key": "test-key"})
+    with ctx:
+        cli_mod.add_record.callback(
+            "example.com", "MX", "@", "mail.example.com", ttl=600, priority=10
+        )
+    patched_client.add_record.assert_called_once_with(
+        "example.com", "MX", "@", "mail.example.com", 600, 10
+    )
+
+
+def test_delete_record(cli_runner, patched_client):
+    """Test deleting a record with the confirmation flag."""
+    result = cli_runner.invoke(
+        cli, ["records", "delete", "example.com", "record-1", "--yes"]
+    )
+    assert result.exit_code == 0
+    assert "Deleted record record-1" in result.output
+
+
+def test_setup_website(cli_runner, patched_client):
+    """Test the setup-website command."""
+    result = cli_runner.invoke(cli, ["setup-website", "example.com", "192.168.1.100"])
+    assert result.exit_code == 0
+    assert "Website setup complete" in result.output
+
+
+def test_setup_email(cli_runner, patched_client):
+    """Test the setup-email command."""
+    result = cli_runner.invoke(cli, ["setup-email", "example.com", "mail.example.com"])
+    assert result.exit_code == 0
+    assert "Email setup complete" in result.output
+
+
+ERROR_PATH_CASES = [
+    pytest.param(
+        "domains",
+        [],
+        ["domains", "list"],
+        0,
+        "No domains found",
+        id="list-domains-empty",
+    ),
+    pytest.param(
+        "get_domain_summary",
+        {"error": "Domain not found"},
+        ["domains", "info", "missing.com"],
+        1,
+        "Domain not found",
+        id="domain-info-error",
+    ),
+    pytest.param(
+        "add_domain",
+        {"error": "Domain already exists"},
+        ["domains", "create", "example.com", "192.168.1.100"],
+        1,
+        "Domain already exists",
+        id="create-domain-error",
+    ),
+    pytest.param(
+        "records",
+        [],
+        ["records", "list", "example.com"],
+        0,
+        "No records found",
+        id="list-records-empty",
+    ),
+    pytest.param(
+        "add_record",
+        {"error": "Invalid record data"},
+        ["records", "add", "example.com", "A", "www", "bad-data"],
+        1,
+        "Invalid record data",
+        id="add-record-error",
+    ),
+    pytest.param(
+        "remove_record",
+        False,
+        ["records", "delete", "example.com", "record-1", "--yes"],
+        1,
+        "Failed to delete record",
+        id="delete-record-failure",
+    ),
+    pytest.param(
+        "setup_basic_website",
+        {
+            "domain": "example.com",
+            "created_records": ["A record for root domain"],
+            "errors": ["WWW A record: API Error"],
+        },
+        ["setup-website", "example.com", "192.168.1.100"],
+        0,
+        "Setup completed with some errors",
+        id="setup-website-with-errors",
+    ),
+    pytest.param(
+        "domains",
+        Exception("API Error"),
+        ["domains", "list"],
+        1,
+        "API Error",
+        id="api-exception",
+    ),
+]
+
+
+@pytest.mark.parametrize("attr,value,argv,exit_code,expect", ERROR_PATH_CASES)
+def test_cli_error_paths(
+    cli_runner, patched_client, attr, value, argv, exit_code, expect
+):
+    """Test empty-result and error paths across the command groups."""
+    method = getattr(patched_client, attr)
+    if isinstance(value, Exception):
+        method.side_effect = value
+    else:
+        method.return_value = value
+    result = cli_runner.invoke(cli, argv)
+    assert result.exit_code == exit_code
+    assert expect in result.output
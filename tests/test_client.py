@@ -0,0 +1,168 @@
+"""Tests for the VultrDNSClient convenience client."""
+
+import pytest
+
+from vultr_dns_mcp.client import VultrDNSClient
+
+pytestmark = pytest.mark.unit
+
+MOCK_API_KEY = "test-api-key-12345"
+
+
+def assert_one_call(mock, *args):
+    """Assert a mock was called exactly once with the given positional args.
+
+    Reads call_args directly instead of assert_called_once_with, which
+    allocates and compares a _Call object per assertion.
+    """
+    assert mock.call_count == 1
+    assert mock.call_args.args == args
+    assert not mock.call_args.kwargs
+
+
+class TestVultrDNSClient:
+    """Test core VultrDNSClient operations."""
+
+    def test_client_creation(self):
+        """Test that the client wraps a VultrDNSServer."""
+        client = VultrDNSClient(MOCK_API_KEY)
+        assert client.server is not None
+        assert client.server.api_key == MOCK_API_KEY
+
+    @pytest.mark.parametrize(
+        "method,args,server_attr,server_args",
+        [
+            ("domains", (), "list_domains", ()),
+            ("domain", ("example.com",), "get_domain", ("example.com",)),
+            (
+                "add_domain",
+                ("newdomain.com", "192.168.1.100"),
+                "create_domain",
+                ("newdomain.com", "192.168.1.100"),
+            ),
+            ("records", ("example.com",), "list_records", ("example.com",)),
+            (
+                "record",
+                ("example.com", "record-1"),
+                "get_record",
+                ("example.com", "record-1"),
+            ),
+            (
+                "add_record",
+                ("example.com", "A", "www", "192.168.1.100", 300, None),
+                "create_record",
+                ("example.com", "A", "www", "192.168.1.100", 300, None),
+            ),
+            (
+                "update_record",
+                ("example.com", "record-1", "A", "www", "192.168.1.200"),
+                "update_record",
+                ("example.com", "record-1", "A", "www", "192.168.1.200", None, None),
+            ),
+        ],
+    )
+    async def test_client_method_forwarding(
+        self, client, patched_server, method, args, server_attr, server_args
+    ):
+        """Test that each passthrough method forwards to the server."""
+        server_method = getattr(patched_server, server_attr)
+        result = await getattr(client, method)(*args)
+        assert result == server_method.return_value
+        assert_one_call(server_method, *server_args)
+
+    @pytest.mark.parametrize("raises,expected", [(False, True), (True, False)])
+    async def test_remove_domain(self, client, patched_server, raises, expected):
+        """Test that domain removal maps success and errors to a bool."""
+        if raises:
+            patched_server.delete_domain.side_effect = Exception("API Error")
+        assert await client.remove_domain("example.com") is expected
+        assert_one_call(patched_server.delete_domain, "example.com")
+
+    @pytest.mark.parametrize("raises,expected", [(False, True), (True, False)])
+    async def test_remove_record(self, client, patched_server, raises, expected):
+        """Test that record removal maps success and errors to a bool."""
+        if raises:
+            patched_server.delete_record.side_effect = Exception("API Error")
+        assert await client.remove_record("example.com", "record-1") is expected
+        assert_one_call(patched_server.delete_record, "example.com", "record-1")
+
+
+class TestConvenienceMethods:
+    """Test the typed record helper methods."""
+
+    @pytest.mark.parametrize(
+        "method,args,expected",
+        [
+            (
+                "add_a_record",
+                ("example.com", "www", "192.168.1.100"),
+                ("example.com", "A", "www", "192.168.1.100", None, None),
+            ),
+            (
+                "add_aaaa_record",
+                ("example.com", "www", "2001:db8::1"),
+                ("example.com", "AAAA", "www", "2001:db8::1", None, None),
+            ),
+            (
+                "add_cname_record",
+                ("example.com", "blog", "example.com"),
+                ("example.com", "CNAME", "blog", "example.com", None, None),
+            ),
+            (
+                "add_mx_record",
+                ("example.com", "@", "mail.example.com", 10),
+                ("example.com", "MX", "@", "mail.example.com", None, 10),
+            ),
+            (
+                "add_txt_record",
+                ("example.com", "@", "v=spf1 ~all"),
+                ("example.com", "TXT", "@", "v=spf1 ~all", None, None),
+            ),
+        ],
+    )
+    async def test_typed_record_helpers(
+        self, client, patched_server, method, args, expected
+    ):
+        """Test that each typed helper forwards the right record type."""
+        await getattr(client, method)(*args)
+        assert_one_call(patched_server.create_record, *expected)
+
+
+class TestUtilityMethods:
+    """Test record search and domain summary helpers."""
+
+    async def test_find_records_by_type(
+        self, client, patched_server, sample_dns_records
+    ):
+        """Test filtering records by type."""
+        patched_server.list_records.return_value = sample_dns_records
+        result = await client.find_records_by_type("example.com", "a")
+        assert len(result) == 2
+        assert all(r["type"] == "A" for r in result)
+
+    async def test_find_records_by_name(
+        self, client, patched_server, sample_dns_records
+    ):
+        """Test filtering records by name."""
+        patched_server.list_records.return_value = sample_dns_records
+        result = await client.find_records_by_name("example.com", "www")
+        assert len(result) == 1
+        assert result[0]["name"] == "www"
+
+    async def test_get_domain_summary(self, client, patched_server, sample_dns_records):
+        """Test the domain summary analysis."""
+        patched_server.get_domain.return_value = {"domain": "example.com"}
+        patched_server.list_records.return_value = sample_dns_records
+        summary = await client.get_domain_summary("example.com")
+        assert summary["total_records"] == 4
+        assert summary["record_types"] == {"A": 2, "MX": 1, "CNAME": 1}
+        assert summary["configuration"]["has_root_record"] is True
+        assert summary["configuration"]["has_www_subdomain"] is True
+        assert summary["configuration"]["has_email_setup"] is True
+
+    async def test_get_domain_summary_error(self, client, patched_server):
+        """Test that summary errors are returned, not raised."""
+        patched_server.get_domain.side_effect = Exception("Domain not found")
+        summary = await client.get_domain_summary("missing.com")
+        assert summary["error"] == "Domain not found"
+        assert summary["domain"] == "missing.com"
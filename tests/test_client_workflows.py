@@ -0,0 +1,59 @@
+"""Tests for the VultrDNSClient multi-record setup workflows.
+
+Kept in their own module so xdist's loadfile scheduling can run them on
+a separate worker from the per-method client tests.
+"""
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+class TestWorkflows:
+    """Test the multi-record setup workflows."""
+
+    async def test_setup_basic_website(self, client, patched_server):
+        """Test setting up website records with www."""
+        patched_server.create_record.return_value = {"id": "r1"}
+        result = await client.setup_basic_website("example.com", "192.168.1.100")
+        assert result["created_records"] == [
+            "A record for root domain",
+            "A record for www subdomain",
+        ]
+        assert result["errors"] == []
+        assert patched_server.create_record.call_count == 2
+
+    async def test_setup_basic_website_without_www(self, client, patched_server):
+        """Test setting up website records without www."""
+        patched_server.create_record.return_value = {"id": "r1"}
+        result = await client.setup_basic_website(
+            "example.com", "192.168.1.100", include_www=False
+        )
+        assert result["created_records"] == ["A record for root domain"]
+        assert patched_server.create_record.call_count == 1
+
+    async def test_setup_basic_website_with_errors(self, client, patched_server):
+        """Test that per-record errors are collected."""
+        patched_server.create_record.return_value = {"error": "API Error"}
+        result = await client.setup_basic_website("example.com", "192.168.1.100")
+        assert result["created_records"] == []
+        assert result["errors"] == [
+            "Root A record: API Error",
+            "WWW A record: API Error",
+        ]
+
+    async def test_setup_email(self, client, patched_server):
+        """Test setting up email records."""
+        patched_server.create_record.return_value = {"id": "r1"}
+        result = await client.setup_email("example.com", "mail.example.com")
+        assert result["created_records"] == ["MX record for mail.example.com"]
+        assert result["errors"] == []
+        patched_server.create_record.assert_called_once_with(
+            "example.com", "MX", "@", "mail.example.com", None, 10
+        )
+
+    async def test_setup_email_with_error(self, client, patched_server):
+        """Test that MX record errors are collected."""
+        patched_server.create_record.return_value = {"error": "Invalid record"}
+        result = await client.setup_email("example.com", "mail.example.com")
+        assert result["errors"] == ["MX record: Invalid record"]
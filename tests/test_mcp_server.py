@@ -0,0 +1,219 @@
+"""Tests for the MCP server over an in-memory client session."""
+
+import asyncio
+from types import MappingProxyType
+
+import pytest
+import pytest_asyncio
+
+pytestmark = [pytest.mark.unit, pytest.mark.mcp]
+
+# Built once and reused as a side_effect; raising doesn't mutate the
+# instance, so there is no need to allocate a fresh exception per test.
+_API_ERR = RuntimeError("API Error")
+
+
+@pytest_asyncio.fixture(scope="module")
+async def mcp_session(mcp_server_session):
+    """Yield one connected client session for the whole module.
+
+    The connect handshake (initialize round-trip) runs once instead of
+    per test; mock state is reseeded between tests by mock_vultr_client.
+    The session context is entered and exited inside one background task
+    because anyio cancel scopes must open and close in the same task,
+    while pytest-asyncio tears fixtures down in a different task.
+    """
+    # Imported lazily so collect-only and -k runs that skip this module
+    # don't pay for the mcp transport import graph.
+    from mcp.shared.memory import create_connected_server_and_client_session
+
+    connected = asyncio.Event()
+    closing = asyncio.Event()
+    holder = {}
+
+    async def _run():
+        async with create_connected_server_and_client_session(
+            mcp_server_session
+        ) as session:
+            holder["session"] = session
+            connected.set()
+            await closing.wait()
+
+    runner = asyncio.create_task(_run())
+    await connected.wait()
+    yield holder["session"]
+    closing.set()
+    await runner
+
+
+# Tool dispatch matrix: (tool, arguments, mock_attr, expected_call_args).
+# Argument payloads are frozen read-only so a test can't mutate a case
+# that later parametrized runs reuse.
+TOOL_CASES = [
+    (tool, MappingProxyType(arguments), mock_attr, expected)
+    for tool, arguments, mock_attr, expected in [
+        ("list_dns_domains", {}, "list_domains", ()),
+        ("get_dns_domain", {"domain": "example.com"}, "get_domain", ("example.com",)),
+        (
+            "create_dns_domain",
+            {"domain": "newdomain.com", "ip": "192.168.1.100"},
+            "create_domain",
+            ("newdomain.com", "192.168.1.100"),
+        ),
+        (
+            "delete_dns_domain",
+            {"domain": "example.com"},
+            "delete_domain",
+            ("example.com",),
+        ),
+        (
+            "list_dns_records",
+            {"domain": "example.com"},
+            "list_records",
+            ("example.com",),
+        ),
+        (
+            "get_dns_record",
+            {"domain": "example.com", "record_id": "record-1"},
+            "get_record",
+            ("example.com", "record-1"),
+        ),
+        (
+            "create_dns_record",
+            {
+                "domain": "example.com",
+                "record_type": "A",
+                "name": "www",
+                "data": "192.168.1.100",
+                "ttl": 300,
+            },
+            "create_record",
+            ("example.com", "A", "www", "192.168.1.100", 300, None),
+        ),
+        (
+            "update_dns_record",
+            {
+                "domain": "example.com",
+                "record_id": "record-1",
+                "record_type": "A",
+                "name": "www",
+                "data": "192.168.1.200",
+            },
+            "update_record",
+            ("example.com", "record-1", "A", "www", "192.168.1.200", None, None),
+        ),
+        (
+            "delete_dns_record",
+            {"domain": "example.com", "record_id": "record-1"},
+            "delete_record",
+            ("example.com", "record-1"),
+        ),
+    ]
+]
+
+
+class TestMCPTools:
+    """Test tool dispatch through the MCP protocol."""
+
+    @pytest.mark.parametrize("tool,arguments,mock_attr,expected", TOOL_CASES)
+    async def test_tool_dispatch(
+        self, mcp_session, mock_vultr_client, tool, arguments, mock_attr, expected
+    ):
+        """Test that each tool forwards its arguments to the API client."""
+        result = await mcp_session.call_tool(tool, arguments)
+        assert not result.isError
+        getattr(mock_vultr_client, mock_attr).assert_called_once_with(*expected)
+
+    async def test_unknown_tool(self, mcp_session, mock_vultr_client):
+        """Test that unknown tool names are reported."""
+        result = await mcp_session.call_tool("not_a_tool", {})
+        assert "Unknown tool" in result.content[0].text
+
+    async def test_tool_error_handling(self, mcp_session, mock_vultr_client):
+        """Test that API errors surface as error text, not exceptions."""
+        mock_vultr_client.list_domains.side_effect = _API_ERR
+        result = await mcp_session.call_tool("list_dns_domains", {})
+        assert "Error: API Error" in result.content[0].text
+
+
+@pytest_asyncio.fixture(scope="module")
+async def resource_uris(mcp_session):
+    """List the advertised resources once and share the URI set."""
+    result = await mcp_session.list_resources()
+    return frozenset(str(resource.uri) for resource in result.resources)
+
+
+class TestMCPResources:
+    """Test resource discovery and reads."""
+
+    def test_domains_resource(self, resource_uris):
+        """Test that the domains resource is advertised."""
+        assert "vultr://domains" in resource_uris
+
+    def test_capabilities_resource(self, resource_uris):
+        """Test that the capabilities resource is advertised."""
+        assert "vultr://capabilities" in resource_uris
+
+    async def test_list_tools(self, mcp_session, mock_vultr_client):
+        """Test that the expected tools are advertised."""
+        result = await mcp_session.list_tools()
+        names = {tool.name for tool in result.tools}
+        assert "list_dns_domains" in names
+        assert "create_dns_record" in names
+        assert "validate_dns_record" in names
+        assert "analyze_dns_records" in names
+
+
+# Validation matrix: (record_type, name, data, priority, expected_valid).
+VALIDATION_CASES = [
+    ("A", "www", "192.168.1.1", None, True),
+    ("A", "www", "999.999.999.999", None, False),
+    ("AAAA", "www", "2001:db8::1", None, True),
+    ("AAAA", "www", "2001::db8::1", None, False),
+    ("CNAME", "@", "example.com", None, False),
+    ("CNAME", "www", "example.com", None, True),
+    ("MX", "@", "mail.example.com", None, False),
+    ("MX", "@", "mail.example.com", 10, True),
+    ("SRV", "_sip._tcp", "0 5 sip.example.com", 10, True),
+    ("SRV", "_sip._tcp", "0 5", 10, False),
+    ("BOGUS", "www", "whatever", None, False),
+]
+
+
+class TestValidationLogic:
+    """Test the validate_dns_record logic.
+
+    The validation function is pure sync logic, so these tests call it
+    directly instead of paying the async transport round-trip; the
+    protocol path is covered once by test_validate_tool_dispatch.
+    """
+
+    @pytest.mark.parametrize(
+        "record_type,name,data,priority,expected_valid", VALIDATION_CASES
+    )
+    def test_record_validation(self, record_type, name, data, priority, expected_valid):
+        """Test record validation across types and edge cases."""
+        from vultr_dns_mcp.server import validate_dns_record
+
+        result = validate_dns_record(record_type, name, data, priority=priority)
+        assert result["validation"]["valid"] is expected_valid
+
+    async def test_validate_tool_dispatch(self, mcp_session, mock_vultr_client):
+        """Test the validation tool end to end through the protocol.
+
+        The valid/invalid pair is independent, so both calls are batched
+        with asyncio.gather over the shared in-memory stream rather than
+        serialized one round-trip at a time.
+        """
+        valid, invalid = await asyncio.gather(
+            mcp_session.call_tool(
+                "validate_dns_record",
+                {"record_type": "A", "name": "www", "data": "192.168.1.1"},
+            ),
+            mcp_session.call_tool(
+                "validate_dns_record",
+                {"record_type": "A", "name": "www", "data": "999.999.999.999"},
+            ),
+        )
+        assert "'valid': True" in valid.content[0].text
+        assert "'valid': False" in invalid.content[0].text
@@ -1,140 +1,176 @@
 """Tests for MCP server functionality."""
 
-import os
-from unittest.mock import AsyncMock, MagicMock, patch
+import re
+from types import MappingProxyType
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from vultr_dns_mcp.server import VultrDNSServer, create_mcp_server
+from vultr_dns_mcp.server import create_mcp_server
+
+# Frozen once; matches the session-scoped vultr_server built from
+# mock_api_key ("test-api-key-12345").
+EXPECTED_HEADERS = MappingProxyType(
+    {
+        "Authorization": "Bearer test-api-key-12345",
+        "Content-Type": "application/json",
+    }
+)
+
+# Compiled once; pytest.raises accepts a pre-compiled match pattern.
+_MISSING_KEY_RE = re.compile(r"VULTR_API_KEY must be provided")
+
+# Handler attribute names across MCP library versions, probed with one
+# dir() walk and set intersections instead of a dozen hasattr calls.
+_TOOL_ATTRS = frozenset(
+    {
+        "_handlers",
+        "handlers",
+        "_tool_handlers",
+        "tool_handlers",
+        "_tools",
+        "tools",
+        "list_tools",
+        "call_tool",
+    }
+)
+_RESOURCE_ATTRS = frozenset(
+    {
+        "_resource_handlers",
+        "resource_handlers",
+        "_resources",
+        "resources",
+        "list_resources",
+        "read_resource",
+    }
+)
+
+# Request matrix: (status, json body, error text, expected result,
+# expected error fragment). 204 returns an empty dict without touching
+# the body; everything outside 200/201/204 raises.
+MAKE_REQUEST_CASES = [
+    pytest.param(200, {"test": "data"}, "", {"test": "data"}, None, id="ok"),
+    pytest.param(
+        201, {"created": "resource"}, "", {"created": "resource"}, None, id="created"
+    ),
+    pytest.param(204, None, "", {}, None, id="no-content"),
+    pytest.param(
+        400, None, "Bad Request", None, "Vultr API error 400: Bad Request",
+        id="bad-request",
+    ),
+    pytest.param(
+        401, None, "Unauthorized", None, "Vultr API error 401: Unauthorized",
+        id="unauthorized",
+    ),
+    pytest.param(
+        429, None, "Rate limit exceeded", None,
+        "Vultr API error 429: Rate limit exceeded", id="rate-limited",
+    ),
+    pytest.param(
+        500, None, "Internal Server Error", None,
+        "Vultr API error 500: Internal Server Error", id="server-error",
+    ),
+]
+
+# Shared request constants for the record tests; frozen so no case can
+# mutate what another row compares against.
+_RECORDS_URL = "/domains/example.com/records"
+_PAYLOAD_MIN = MappingProxyType(
+    {"type": "A", "name": "www", "data": "192.168.1.100"}
+)
+
+# create_record matrix: (optional kwargs, fields they add to the payload).
+# ttl and priority must only appear in the payload when given.
+CREATE_RECORD_CASES = [
+    pytest.param({}, {}, id="minimal"),
+    pytest.param({"ttl": 600}, {"ttl": 600}, id="with-ttl"),
+    pytest.param({"priority": 10}, {"priority": 10}, id="with-priority"),
+    pytest.param(
+        {"ttl": 300, "priority": 10}, {"ttl": 300, "priority": 10}, id="full"
+    ),
+]
 
 
 @pytest.mark.unit
 class TestMCPServer:
     """Test MCP server creation and basic functionality."""
 
-    def test_create_mcp_server_with_api_key(self):
-        """Test creating MCP server with API key."""
-        server = create_mcp_server("test-api-key")
+    @pytest.mark.parametrize(
+        "api_key", ["test-api-key", None], ids=["explicit", "env"]
+    )
+    def test_server_name(self, monkeypatch, api_key):
+        """Test the advertised server name across construction paths."""
+        if api_key is None:
+            monkeypatch.setenv("VULTR_API_KEY", "env-api-key")
+        server = create_mcp_server(api_key)
         assert server is not None
         assert server.name == "vultr-dns-mcp"
 
     def test_create_mcp_server_without_api_key(self):
         """Test creating MCP server without API key raises error."""
-        with pytest.raises(ValueError, match="VULTR_API_KEY must be provided"):
+        with pytest.raises(ValueError, match=_MISSING_KEY_RE):
             create_mcp_server()
 
-    @patch.dict("os.environ", {"VULTR_API_KEY": "env-api-key"})
-    def test_create_mcp_server_from_env(self):
-        """Test creating MCP server with API key from environment."""
-        server = create_mcp_server()
-        assert server is not None
-        assert server.name == "vultr-dns-mcp"
-
-    def test_server_has_expected_tools(self):
+    def test_server_has_expected_tools(self, built_server):
         """Test that server has expected tool handlers."""
-        server = create_mcp_server("test-api-key")
-
-        # Check that server has proper handlers based on available attributes
-        # Different MCP versions may have different attribute names
-        has_tools = (
-            hasattr(server, "_handlers") or 
-            hasattr(server, "handlers") or
-            hasattr(server, "_tool_handlers") or
-            hasattr(server, "tool_handlers") or
-            hasattr(server, "_tools") or
-            hasattr(server, "tools") or
-            callable(getattr(server, "list_tools", None)) or
-            callable(getattr(server, "call_tool", None))
-        )
-        
-        has_resources = (
-            hasattr(server, "_resource_handlers") or
-            hasattr(server, "resource_handlers") or
-            hasattr(server, "_resources") or
-            hasattr(server, "resources") or
-            callable(getattr(server, "list_resources", None)) or
-            callable(getattr(server, "read_resource", None))
-        )
-        
         # Server should have either tools or resources configured
-        assert has_tools or has_resources, "Server should have tools or resources configured"
-
-    def test_server_info(self):
-        """Test server information and metadata."""
-        server = create_mcp_server("test-api-key")
-
-        assert server.name == "vultr-dns-mcp"
-        # Check for version attribute (may be in different locations)
-        has_version = (
-            hasattr(server, "version") or 
-            hasattr(server, "_version") or
-            hasattr(server, "__version__")
-        )
-        # Version attribute is optional, so we don't assert it
+        caps = frozenset(dir(built_server))
+        assert (
+            caps & _TOOL_ATTRS or caps & _RESOURCE_ATTRS
+        ), "Server should have tools or resources configured"
 
 
 @pytest.mark.unit
 class TestVultrDNSServer:
     """Test VultrDNSServer class functionality."""
 
-    @pytest.fixture
-    def mock_api_key(self):
-        """Provide a mock API key for testing."""
-        return "test-api-key-12345"
-
-    def test_vultr_dns_server_creation(self, mock_api_key):
+    def test_vultr_dns_server_creation(self, vultr_server, mock_api_key):
         """Test VultrDNSServer instantiation."""
-        server = VultrDNSServer(mock_api_key)
-        assert server.api_key == mock_api_key
-        assert server.base_url == "https://api.vultr.com/v2"
+        assert vultr_server.api_key == mock_api_key
+        assert vultr_server.base_url == "https://api.vultr.com/v2"
 
-    def test_vultr_dns_server_headers(self, mock_api_key):
+    def test_vultr_dns_server_headers(self, vultr_server):
         """Test that server sets correct headers."""
-        server = VultrDNSServer(mock_api_key)
-        expected_headers = {
-            "Authorization": f"Bearer {mock_api_key}",
-            "Content-Type": "application/json",
-        }
-        assert server.headers == expected_headers
-
-    @pytest.mark.asyncio
-    async def test_make_request_success(self, mock_api_key):
-        """Test successful API request."""
-        server = VultrDNSServer(mock_api_key)
-
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"test": "data"}
-
-            # Properly mock the async context manager
-            mock_client_instance = MagicMock()
-            mock_client.return_value.__aenter__ = AsyncMock(return_value=mock_client_instance)
-            mock_client.return_value.__aexit__ = AsyncMock(return_value=None)
-            mock_client_instance.request = AsyncMock(return_value=mock_response)
-
-            result = await server._make_request("GET", "/test")
-            assert result == {"test": "data"}
-
-    @pytest.mark.asyncio
-    async def test_make_request_error(self, mock_api_key):
-        """Test API request with error response."""
-        server = VultrDNSServer(mock_api_key)
-
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 400
-            mock_response.text = "Bad Request"
-
-            mock_client_instance = MagicMock()
-            mock_client.return_value.__aenter__ = AsyncMock(return_value=mock_client_instance)
-            mock_client.return_value.__aexit__ = AsyncMock(return_value=None)
-            mock_client_instance.request = AsyncMock(return_value=mock_response)
+        assert vultr_server.headers == EXPECTED_HEADERS
+
+    @pytest.mark.parametrize(
+        "status,json_data,text,expected,error_fragment", MAKE_REQUEST_CASES
+    )
+    async def test_make_request(
+        self,
+        vultr_server,
+        mock_httpx_client,
+        build_response,
+        status,
+        json_data,
+        text,
+        expected,
+        error_fragment,
+    ):
+        """Test API requests across success and error status codes."""
+        mock_httpx_client.request.return_value = build_response(
+            status, json_data=json_data, text=text
+        )
 
-            with pytest.raises(Exception) as exc_info:
-                await server._make_request("GET", "/test")
+        if error_fragment is None:
+            result = await vultr_server._make_request("GET", "/test")
+            assert result == expected
+        else:
+            with pytest.raises(Exception, match=re.escape(error_fragment)):
+                await vultr_server._make_request("GET", "/test")
+
+    @pytest.mark.parametrize("kwargs,extra", CREATE_RECORD_CASES)
+    async def test_create_record_payload(
+        self, vultr_server, mock_request, kwargs, extra
+    ):
+        """Test that create_record only sends the fields it was given."""
+        await vultr_server.create_record(
+            "example.com", "A", "www", "192.168.1.100", **kwargs
+        )
 
-            assert "Bad Request" in str(exc_info.value)
+        mock_request.assert_called_once_with(
+            "POST", _RECORDS_URL, {**_PAYLOAD_MIN, **extra}
+        )
 
 
 @pytest.mark.integration
@@ -149,33 +185,27 @@ class TestServerIntegration:
             server = create_mcp_server("test-api-key")
             assert server is not None
 
-    def test_server_environment_integration(self):
+    def test_server_environment_integration(self, monkeypatch):
         """Test server respects environment configuration."""
         # Test without environment variable
-        if "VULTR_API_KEY" in os.environ:
-            del os.environ["VULTR_API_KEY"]
+        monkeypatch.delenv("VULTR_API_KEY", raising=False)
 
         with pytest.raises(ValueError):
             create_mcp_server()
 
         # Test with environment variable
-        os.environ["VULTR_API_KEY"] = "test-key"
-        try:
-            server = create_mcp_server()
-            assert server is not None
-        finally:
-            del os.environ["VULTR_API_KEY"]
+        monkeypatch.setenv("VULTR_API_KEY", "test-key")
+        server = create_mcp_server()
+        assert server is not None
 
 
 @pytest.mark.unit
-def test_server_constants():
+def test_server_constants(vultr_server):
     """Test server constants and configuration."""
-    server = VultrDNSServer("test-key")
-
     # Test API base URL
-    assert server.base_url.startswith("https://")
-    assert "vultr.com" in server.base_url
+    assert vultr_server.base_url.startswith("https://")
+    assert "vultr.com" in vultr_server.base_url
 
     # Test that headers include authorization
-    assert "Authorization" in server.headers
-    assert "Bearer" in server.headers["Authorization"]
+    assert "Authorization" in vultr_server.headers
+    assert "Bearer" in vultr_server.headers["Authorization"]
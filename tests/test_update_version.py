@@ -0,0 +1,90 @@
+"""Tests for the scripts/update_version.py release helper."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import update_version
+
+pytestmark = pytest.mark.unit
+
+SAMPLE_PYPROJECT = """\
+[build-system]
+requires = ["setuptools"]
+
+[project]
+name = "vultr-dns-mcp"
+version = "1.0.4"
+description = "example"
+"""
+
+# No [project] table, so the splice path bails and the regex fallback
+# has to do the replacement.
+FALLBACK_PYPROJECT = """\
+[tool.poetry]
+name = "vultr-dns-mcp"
+version = "1.0.4"
+"""
+
+
+class TestValidateVersion:
+    """Test semver validation across fast and regex paths."""
+
+    @pytest.mark.parametrize(
+        "version",
+        ["0.0.1", "1.0.4", "10.20.30", "1.2.3-rc.1", "1.2.3+build.5"],
+    )
+    def test_valid_versions(self, version):
+        """Test that well-formed versions are accepted."""
+        assert update_version.validate_version(version)
+
+    @pytest.mark.parametrize(
+        "version",
+        ["1.2", "1.2.3.4", "01.2.3", "a.b.c", "١.٢.٣", ""],  # noqa: RUF001
+    )
+    def test_invalid_versions(self, version):
+        """Test that malformed versions are rejected."""
+        assert not update_version.validate_version(version)
+
+
+class TestGetVersion:
+    """Test version extraction from pyproject content."""
+
+    def test_get_version(self):
+        """Test that the version field is extracted."""
+        assert update_version.get_version(SAMPLE_PYPROJECT) == "1.0.4"
+
+    def test_get_version_missing(self):
+        """Test that content without a version field raises."""
+        with pytest.raises(ValueError, match="No version field"):
+            update_version.get_version("[project]\nname = 'x'\n")
+
+
+class TestRenderPyproject:
+    """Test the version splice and its regex fallback."""
+
+    @pytest.mark.parametrize(
+        "content", [SAMPLE_PYPROJECT, FALLBACK_PYPROJECT], ids=["splice", "fallback"]
+    )
+    def test_render_replaces_version(self, content):
+        """Test that only the version line changes."""
+        rendered = update_version._render_pyproject(content, "2.0.0")
+        assert update_version.get_version(rendered) == "2.0.0"
+        assert rendered == content.replace('version = "1.0.4"', 'version = "2.0.0"')
+
+
+class TestAtomicWrite:
+    """Test the temp-file-and-replace write."""
+
+    def test_atomic_write(self, tmp_path):
+        """Test that content lands in place with no temp files left."""
+        target = tmp_path / "pyproject.toml"
+        target.write_text(SAMPLE_PYPROJECT)
+
+        update_version._atomic_write(target, "replaced\n")
+
+        assert target.read_text() == "replaced\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["pyproject.toml"]